@@ -1,29 +1,101 @@
 import sys
 import os
+import stat
+import asyncio
+import errno
+import mmap
 import json
 import time
+import platform
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from threading import Event
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QMutex, QMutexLocker
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QMutex, QMutexLocker, QSize, QSortFilterProxyModel
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QProgressBar, QPushButton, QFileDialog,
+    QTableView, QProgressBar, QPushButton, QFileDialog,
     QSlider, QLabel, QHeaderView, QAbstractItemView, QComboBox, QTextEdit,
-    QMessageBox, QDialog
+    QMessageBox, QDialog, QSpinBox, QStyledItemDelegate, QStyleOptionProgressBar, QStyle
 )
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QStandardItemModel, QStandardItem
+
+try:
+    import liburing  # optional io_uring bindings, only used on Linux
+except ImportError:
+    liburing = None
+
+try:
+    import orjson  # optional, much faster than the json module for the saved state
+except ImportError:
+    orjson = None
 
 # Store data file in current working directory
 data_file = Path.cwd() / "file_checker_data.json"
 AUTO_SAVE_INTERVAL_MS = 2000  # Save every 2 seconds
+GUI_FLUSH_INTERVAL_MS = 100  # Worker updates are coalesced and applied to the table at this rate
+URING_AVAILABLE = liburing is not None and platform.system() == "Linux"
+MiB = 1024 * 1024
+# Pacing sleeps shorter than this are skipped, the deadline keeps accumulating so the
+# average speed stays on target (sub-ms sleeps round up to ~15 ms on Windows anyway)
+PACING_SLACK_S = 0.001
+
+# O_DIRECT reads must start on a block boundary; 4096 covers both 512e and 4Kn drives
+DIRECT_IO_ALIGNMENT = 4096
+O_DIRECT = getattr(os, 'O_DIRECT', 0)  # Linux only
+HAVE_FADVISE = hasattr(os, 'posix_fadvise')  # not on Windows / macOS
+
+# Bundled builds keep their resources in _internal, checked once instead of listing the cwd per call
+_INTERNAL = '_internal' if os.path.isdir('_internal') else ''
 
 def get_running_path(relative_path):
-    if '_internal' in os.listdir():
-        return os.path.join('_internal', relative_path)
+    if _INTERNAL:
+        return os.path.join(_INTERNAL, relative_path)
     else:
         return relative_path
 
 
+def open_unbuffered(path):
+    """Open a raw (unbuffered) file for reading, bypassing the page cache when possible. Returns (file, direct)"""
+    if O_DIRECT:
+        try:
+            return open(os.open(path, os.O_RDONLY | O_DIRECT), 'rb', buffering=0), True
+        except OSError as e:
+            # tmpfs and some network filesystems reject O_DIRECT
+            if e.errno != errno.EINVAL:
+                raise
+    return open(path, 'rb', buffering=0), False
+
+
+def scan_folder(root):
+    """Yield (path, size) for every file below root, reusing the stat data os.scandir already has"""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue  # skipped, like rglob does
+        with it:
+            for entry in it:
+                # Like rglob: don't descend into symlinked folders, but do list symlinked files
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path, entry.stat().st_size
+
+
+if hasattr(os, 'preadv'):
+    def pread_into(f, view, offset):
+        """Read into a pre-allocated buffer at the given offset, returns the number of bytes read"""
+        return os.preadv(f.fileno(), [view], offset)
+else:
+    def pread_into(f, view, offset):
+        # No positional reads on Windows, seek and read straight into the buffer instead
+        f.seek(offset)
+        return f.readinto(view)
+
+
 class SaveWorker(QThread):
     """Thread for saving data to avoid GUI freezes"""
     save_complete = Signal()
@@ -58,19 +130,21 @@ class SaveWorker(QThread):
 
             if data_to_save is not None:
                 try:
+                    # The state is only read back by this app, so no indentation
+                    if orjson is not None:
+                        payload = orjson.dumps(data_to_save)
+                    else:
+                        payload = json.dumps(data_to_save, separators=(',', ':')).encode()
+
                     # Save to temporary file first, then rename (atomic operation)
-                    temp_file = self.data_file.with_suffix('.tmp')
-                    with open(temp_file, 'w') as f:
-                        json.dump(data_to_save, f, indent=2)
-
-                    # Atomic replace
-                    if os.name == 'nt':  # Windows
-                        # On Windows, we can't atomically replace, so we'll just overwrite
-                        if self.data_file.exists():
-                            self.data_file.unlink()
-                        temp_file.rename(self.data_file)
-                    else:  # Unix-like systems
-                        temp_file.replace(self.data_file)
+                    temp_file = self.data_file.with_suffix('.json.tmp')
+                    with open(temp_file, 'wb') as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())  # make sure the data is on disk before it replaces the old file
+
+                    # Atomic replace, os.replace also overwrites an existing file on Windows
+                    os.replace(temp_file, self.data_file)
 
                     self.save_complete.emit()
                 except Exception as e:
@@ -86,31 +160,37 @@ class SaveWorker(QThread):
 
 
 class FileReadWorker(QThread):
-    progress = Signal(str, int)
-    current_speed = Signal(str, float)
-    min_speed = Signal(str, float)
-    max_wait = Signal(str, float)
+    """Scans several files at once from an asyncio loop, the blocking reads run on a small thread pool"""
+    # One signal per GUI update carrying any of: progress, cur_speed, min_speed, max_wait, size (if it changed)
+    stats = Signal(str, dict)
     verdict = Signal(str, bool)
     finished_all = Signal()
 
     # Threshold: fail if chunk speed too low
     MIN_SPEED_MB_S = 0.1  # MB/s
+    DEFAULT_PARALLEL_FILES = 1  # one file at a time keeps an HDD from seeking; the GUI allows up to 16
 
-    def __init__(self, tasks, chunk_size_mb, speed_limit_mb_s, stop_event):
+    def __init__(self, tasks, chunk_size_mb, speed_limit_mb_s, stop_event, max_files=DEFAULT_PARALLEL_FILES):
         super().__init__()
         self.tasks = tasks
-        self.chunk_size = int(chunk_size_mb * 1024 * 1024)
+        self.max_files = max_files
+        self.chunk_size = int(chunk_size_mb * MiB)
         self.speed_limit = speed_limit_mb_s
         self.stop_event = stop_event
+        # Token bucket shared by all files: the next read may only start once the previous ones have been "paid for"
+        self._next_ok_ns = 0
 
     def run(self):
-        # We read in smaller sub-chunks to smooth out the speed.
-        if self.speed_limit > 100:
-            SUB_CHUNK_SIZE = 1024 * 1024  # 1MB for very high speeds
-        elif self.speed_limit > 50:
-            SUB_CHUNK_SIZE = 512 * 1024  # 512KB
-        else:
-            SUB_CHUNK_SIZE = 64 * 1024  # 64KB for low speeds
+        try:
+            asyncio.run(self._scan_all())
+        finally:
+            # The GUI waits for this to re-enable Start, even if the scan itself blew up
+            self.finished_all.emit()
+
+    async def _scan_all(self):
+        # We read in sub-chunks of ~50 ms of the speed budget to smooth out the speed,
+        # 1MB from 20 MB/s up, never below 64KB; multiples of 64KB keep O_DIRECT aligned
+        SUB_CHUNK_SIZE = min(MiB, max(64 * 1024, self.speed_limit * MiB // 20 // (64 * 1024) * (64 * 1024)))
 
         # We only send signals to the GUI at a fixed interval.
         if self.speed_limit > 50:
@@ -118,116 +198,483 @@ class FileReadWorker(QThread):
         else:
             GUI_UPDATE_INTERVAL_S = 0.2  # 5 updates per second for normal speeds
 
-        for path, start in self.tasks:
-            if self.stop_event.is_set():
-                break
-
+        self._next_ok_ns = time.monotonic_ns()
+        # A fixed set of lanes pulls files off one queue, no task per file is created up front
+        pending = deque(self.tasks)
+        with ThreadPoolExecutor(max_workers=self.max_files) as executor:
+            await asyncio.gather(*(
+                self._scan_lane(pending, executor, SUB_CHUNK_SIZE, GUI_UPDATE_INTERVAL_S)
+                for _ in range(min(self.max_files, len(pending)))
+            ))
+
+    async def _throttle(self, nbytes):
+        """Reserve the time needed to read nbytes at the speed limit, returns how long we slept"""
+        now_ns = time.monotonic_ns()
+        start_ns = max(self._next_ok_ns, now_ns)
+        self._next_ok_ns = start_ns + nbytes * 1_000_000_000 // (self.speed_limit * MiB)
+        if start_ns - now_ns <= PACING_SLACK_S * 1e9:
+            return 0.0
+        sleep_duration = (start_ns - now_ns) / 1e9
+        await asyncio.sleep(sleep_duration)
+        return sleep_duration
+
+    async def _scan_lane(self, pending, executor, SUB_CHUNK_SIZE, GUI_UPDATE_INTERVAL_S):
+        """Read files off the shared queue one after another until it is empty or the scan is stopped"""
+        # One reusable buffer per lane; anonymous mmap memory is page aligned, as O_DIRECT requires
+        view = memoryview(mmap.mmap(-1, self.chunk_size))
+        while pending and not self.stop_event.is_set():
+            path, start, file_size = pending.popleft()
             try:
-                file_size = path.stat().st_size
-                if file_size == 0:
-                    self.verdict.emit(str(path), True)
-                    self.progress.emit(str(path), 100)
-                    continue
-
-                read = start
-                min_speed_val = float('inf')
-                max_wait_val = 0
-                completed = False
-
-                last_gui_update_time = time.time()
-
-                with open(path, 'rb') as f:
-                    f.seek(read)
-                    while read < file_size:
-                        if self.stop_event.is_set():
-                            break
+                await self._read_file(path, start, file_size, view, executor, SUB_CHUNK_SIZE,
+                                      GUI_UPDATE_INTERVAL_S)
+            except Exception as e:
+                print(f"Error processing {path}: {e}")  # Good to log errors
+                self.verdict.emit(str(path), False)
 
-                        chunk_read_start_time = time.time()
-                        bytes_read_in_chunk = 0
-                        sum_of_sleep_times = 0.0  # Initialize sleep time tracker
+    async def _read_file(self, path, start, file_size, view, executor, SUB_CHUNK_SIZE, GUI_UPDATE_INTERVAL_S):
+        loop = asyncio.get_running_loop()
+        path_str = str(path)
 
-                        # This inner loop reads one 'self.chunk_size' in smaller pieces
-                        while bytes_read_in_chunk < self.chunk_size and read < file_size:
-                            if self.stop_event.is_set():
-                                break
+        f, direct = open_unbuffered(path)
+        try:
+            # The size cached when the file was listed can be stale, go by the open file instead
+            actual_size = os.fstat(f.fileno()).st_size
+        except OSError:
+            f.close()
+            raise
+        if actual_size != file_size:
+            # Changed since it was listed: report the new size, the old resume point means nothing now
+            self.stats.emit(path_str, {'size': actual_size})
+            file_size = actual_size
+            start = 0
+        if file_size == 0:
+            f.close()
+            self.verdict.emit(path_str, True)
+            self.stats.emit(path_str, {'progress': 100})
+            return
+        if start >= file_size:
+            start = 0  # nothing left after the resume point, read it all again
+
+        read = start
+        min_speed_val = float('inf')
+        max_wait_val = 0
+        sleep_duration = 0.0
+        last_pct = -1
+        completed = False
+
+        # Speed is measured over the chunks of the last second, single chunks are too noisy
+        speed_window = deque()  # (chunk end ns, bytes, read ns)
+        window_bytes = 0
+        window_read_ns = 0
+
+        # Local aliases for the attributes and functions used on every read
+        chunk_size = self.chunk_size
+        min_speed_threshold = self.MIN_SPEED_MB_S
+        stopped = self.stop_event.is_set
+        monotonic_ns = time.monotonic_ns
+        emit_stats = self.stats.emit
+        pct_scale = 100 / file_size
+        # Most reads are a full sub-chunk, slice the view for that size once instead of per read
+        sub_view = view[:SUB_CHUNK_SIZE]
+
+        last_gui_update_ns = monotonic_ns()
 
-                            # Calculate sleep time based on the small sub-chunk size
-                            # to maintain the target speed limit.
-                            bytes_to_read = min(SUB_CHUNK_SIZE, self.chunk_size - bytes_read_in_chunk, file_size - read)
+        try:
+            if direct:
+                read -= read % DIRECT_IO_ALIGNMENT
+            elif HAVE_FADVISE:
+                # Buffered reads go through the page cache, ask for aggressive readahead
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            while read < file_size:
+                if stopped():
+                    break
 
-                            # Target time for this sub-chunk
-                            target_time_per_sub_chunk = (bytes_to_read / (1024 * 1024)) / self.speed_limit
+                bytes_read_in_chunk = 0
+                chunk_read_ns = 0  # time spent in reads only, not including sleep
+                n = 0
+
+                # This inner loop reads one 'self.chunk_size' in smaller pieces
+                while bytes_read_in_chunk < chunk_size and read < file_size:
+                    if stopped():
+                        break
+
+                    bytes_to_read = min(SUB_CHUNK_SIZE, chunk_size - bytes_read_in_chunk)
+                    if not direct:
+                        # O_DIRECT lengths must stay aligned, the read just comes back short at EOF
+                        bytes_to_read = min(bytes_to_read, file_size - read)
+
+                    # Sleep to throttle the speed
+                    slept = await self._throttle(bytes_to_read)
+                    if slept:
+                        sleep_duration = slept
+
+                    target = sub_view if bytes_to_read == SUB_CHUNK_SIZE else view[:bytes_to_read]
+                    sub_chunk_t0 = monotonic_ns()
+                    try:
+                        n = await loop.run_in_executor(executor, pread_into, f, target, read)
+                    except OSError as e:
+                        if not (direct and e.errno == errno.EINVAL):
+                            raise
+                        # The filesystem accepted O_DIRECT on open but rejects it on read
+                        f.close()
+                        f, direct = open(path, 'rb', buffering=0), False
+                        if HAVE_FADVISE:
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        n = await loop.run_in_executor(executor, pread_into, f, target, read)
+                    if not n:
+                        # The file got shorter while being read
+                        raise EOFError(f"file ended at {read} of {file_size} bytes")
+
+                    chunk_read_ns += monotonic_ns() - sub_chunk_t0
+                    read += n
+                    bytes_read_in_chunk += n
+
+                if not n:  # Stopped before anything was read
+                    break
 
-                            sub_chunk_t0 = time.time()
-                            data = f.read(bytes_to_read)
-                            if not data:
-                                break  # End of file reached unexpectedly
+                # Now calculate metrics over the sliding window, including the chunk just processed
+                now_ns = monotonic_ns()
+                speed_window.append((now_ns, bytes_read_in_chunk, chunk_read_ns))
+                window_bytes += bytes_read_in_chunk
+                window_read_ns += chunk_read_ns
+                while len(speed_window) > 1 and now_ns - speed_window[0][0] > 1_000_000_000:
+                    _, old_bytes, old_read_ns = speed_window.popleft()
+                    window_bytes -= old_bytes
+                    window_read_ns -= old_read_ns
+
+                if window_read_ns == 0:
+                    speed_val = float('inf')
+                else:
+                    speed_val = (window_bytes / MiB) / (window_read_ns / 1e9)
+
+                # Only perform speed check on full chunks to avoid false negatives at EOF
+                if bytes_read_in_chunk == chunk_size and speed_val < min_speed_threshold:
+                    self.verdict.emit(path_str, False)
+                    break  # Stop processing this file
+
+                # Track min / max on every chunk, not only on GUI ticks, so none is missed
+                if speed_val < min_speed_val:
+                    min_speed_val = speed_val
+                if sleep_duration > max_wait_val:
+                    max_wait_val = sleep_duration
+
+                # Check if it's time to send an update to the GUI
+                if now_ns - last_gui_update_ns > GUI_UPDATE_INTERVAL_S * 1e9:
+                    update = {
+                        'cur_speed': speed_val,
+                        'min_speed': min_speed_val,
+                        'max_wait': max_wait_val,
+                    }
+                    # Large files stay on the same percent for many updates, only send it on change
+                    pct = int(read * pct_scale)
+                    if pct != last_pct:
+                        update['progress'] = last_pct = pct
+                    emit_stats(path_str, update)
+                    last_gui_update_ns = now_ns
+            else:
+                # This 'else' block runs only if the 'while' loop completes
+                # without a 'break'. This means the file was read completely.
+                completed = True
+        finally:
+            if HAVE_FADVISE and not direct:
+                # One-shot scan, don't leave the file behind in the page cache
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            f.close()
+
+        if completed:
+            # For files that process faster than the GUI update interval, no signals
+            # would have been sent. This block ensures a final, complete update is
+            # always sent upon successful completion.
+            self.stats.emit(path_str, {
+                'progress': 100,
+                'cur_speed': speed_val,
+                'min_speed': min_speed_val,
+                'max_wait': max_wait_val,
+            })
+            self.verdict.emit(path_str, True)
+
+
+class UringFileReader(FileReadWorker):
+    """io_uring backend: reads all pending files at once through one shared ring"""
+    QUEUE_DEPTH = 64
+    MAX_OPEN_FILES = 512
+    # Punt buffered reads straight to the kernel workers instead of trying them inline on submit.
+    # The ring only gets buffered fds (its bytearray buffers cannot meet O_DIRECT alignment).
+    ASYNC_BUFFERED_READS = True
+
+    def __init__(self, tasks, chunk_size_mb, speed_limit_mb_s, stop_event,
+                 max_files=FileReadWorker.DEFAULT_PARALLEL_FILES):
+        super().__init__(tasks, chunk_size_mb, speed_limit_mb_s, stop_event, max_files)
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        self.fixed_files = True  # registered file table, cleared if the kernel has no sparse tables
+        try:
+            liburing.io_uring_queue_init(self.QUEUE_DEPTH, self.ring, 0)
+        except OSError as e:
+            # io_uring can be disabled by the kernel or a sandbox, use the blocking read loop instead
+            print(f"io_uring unavailable, falling back to blocking reads: {e}")
+            self.ring = None
 
-                            elapsed_for_sub_chunk = time.time() - sub_chunk_t0
+    def run(self):
+        if self.ring is None:
+            super().run()
+            return
 
-                            # Sleep to throttle the speed
-                            sleep_duration = max(0, target_time_per_sub_chunk - elapsed_for_sub_chunk)
-                            time.sleep(sleep_duration)
-                            sum_of_sleep_times += sleep_duration  # Track total sleep time
+        try:
+            self._scan_all_uring()
+        finally:
+            liburing.io_uring_queue_exit(self.ring)
+            # The GUI waits for this to re-enable Start, even if the scan itself blew up
+            self.finished_all.emit()
+
+    def _reap(self):
+        """Wait for one completion and return its (tag, result)"""
+        liburing.io_uring_wait_cqe(self.ring, self.cqe)
+        entry = self.cqe[0]
+        tag, res = entry.user_data, entry.res
+        liburing.io_uring_cq_advance(self.ring, 1)
+        return tag, res
+
+    def _open_file(self, path, start, file_size, slot):
+        """Open one task and register its fd in the given slot; returns its state or None if already done"""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except Exception as e:
+            print(f"Error processing {path}: {e}")
+            self.verdict.emit(str(path), False)
+            return None
+        try:
+            # The size cached when the file was listed can be stale, go by the open file instead
+            actual_size = os.fstat(fd).st_size
+            if actual_size != file_size:
+                # Changed since it was listed: report the new size, the old resume point means nothing now
+                self.stats.emit(str(path), {'size': actual_size})
+                file_size = actual_size
+                start = 0
+            if file_size == 0:
+                os.close(fd)
+                self.verdict.emit(str(path), True)
+                self.stats.emit(str(path), {'progress': 100})
+                return None
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except Exception as e:
+            os.close(fd)
+            print(f"Error processing {path}: {e}")
+            self.verdict.emit(str(path), False)
+            return None
+        if start >= file_size:
+            start = 0  # nothing left after the resume point, read it all again
+
+        if self.fixed_files:
+            liburing.io_uring_register_files_update(self.ring, liburing.FileIndex([fd]), slot)
+        return {
+            'path': str(path),
+            'size': file_size,
+            'pct_scale': 100 / file_size,
+            'fd': fd,
+            'slot': slot,
+            'target': slot if self.fixed_files else fd,  # what the SQEs read from
+            'read': start,  # contiguous bytes confirmed readable, this is what progress reports
+            'next_offset': start,
+            'done': {},  # completions that arrived ahead of 'read'
+            'inflight': 0,
+            'failed': False,
+            'error': None,
+            'speed': 0.0,
+            'min_speed': float('inf'),
+            'max_wait': 0,
+            'last_pct': -1,
+            'last_gui_update': time.monotonic(),
+        }
+
+    def _close_file(self, state):
+        if self.fixed_files:
+            liburing.io_uring_register_files_update(self.ring, liburing.FileIndex([-1]), state['slot'])
+        # One-shot scan, don't leave the file behind in the page cache
+        os.posix_fadvise(state['fd'], 0, 0, os.POSIX_FADV_DONTNEED)
+        os.close(state['fd'])
+
+    def _scan_all_uring(self):
+        # Not an override of the async _scan_all, the fallback in run() still needs that one
+        if self.speed_limit > 50:
+            GUI_UPDATE_INTERVAL_S = 0.5
+        else:
+            GUI_UPDATE_INTERVAL_S = 0.2
+
+        pending = deque(self.tasks)
+        active = []  # opened files, until their last read completes
+        ready = deque()  # opened files that still have chunks to submit, served round robin
+        free_slots = list(range(self.MAX_OPEN_FILES - 1, -1, -1))
+        inflight = {}  # tag -> (file state, offset, buffer index, submit time)
+        next_tag = 0
+        next_submit_time = time.monotonic()
+        last_completion_time = next_submit_time
+        sleep_duration = 0.0
+
+        # One buffer per queue slot, registered once so the kernel does not pin pages for every read
+        buffers = [bytearray(self.chunk_size) for _ in range(self.QUEUE_DEPTH)]
+        free_buffers = list(range(self.QUEUE_DEPTH))
+        iovecs = liburing.Iovec(buffers)  # must stay referenced while registered
+        try:
+            liburing.io_uring_register_buffers(self.ring, iovecs)
+            fixed_buffers = True
+        except OSError as e:
+            # Registered buffers count against RLIMIT_MEMLOCK, plain reads work without them
+            print(f"Could not register io_uring buffers, using plain reads: {e}")
+            fixed_buffers = False
 
-                            read += len(data)
-                            bytes_read_in_chunk += len(data)
+        try:
+            liburing.io_uring_register_files_sparse(self.ring, self.MAX_OPEN_FILES)
+        except OSError as e:
+            # Sparse file tables need kernel 5.19, older rings still read from plain fds
+            print(f"Could not register io_uring files, using plain fds: {e}")
+            self.fixed_files = False
 
-                        if not data:  # Break outer loop if EOF was hit
-                            break
+        sqe_flags = liburing.IOSQE_FIXED_FILE if self.fixed_files else 0
+        if self.ASYNC_BUFFERED_READS:
+            sqe_flags |= liburing.IOSQE_ASYNC
 
-                        # Now calculate metrics for the whole chunk that was just processed
-                        chunk_total_time = time.time() - chunk_read_start_time
+        try:
+            while True:
+                stopping = self.stop_event.is_set()
+
+                while not stopping and pending and free_slots and len(active) < self.max_files:
+                    path, start, file_size = pending.popleft()
+                    state = self._open_file(path, start, file_size, free_slots[-1])
+                    if state is not None:
+                        free_slots.pop()
+                        active.append(state)
+                        ready.append(state)
+
+                # Top up the queue; submissions are paced so the overall rate follows the speed limit
+                queued = 0
+                while not stopping and ready and len(inflight) < self.QUEUE_DEPTH:
+                    state = ready.popleft()
+                    if state['failed']:
+                        continue
+
+                    now = time.monotonic()
+                    if next_submit_time - now > PACING_SLACK_S:
+                        if inflight:
+                            ready.appendleft(state)
+                            break  # reap completions instead of sleeping
+                        sleep_duration = next_submit_time - now
+                        time.sleep(sleep_duration)
+                        now = next_submit_time
+                    next_submit_time = max(next_submit_time, now) + self.chunk_size / (self.speed_limit * MiB)
+
+                    buf_index = free_buffers.pop()
+                    sqe = liburing.io_uring_get_sqe(self.ring)
+                    if fixed_buffers:
+                        liburing.io_uring_prep_read_fixed(sqe, state['target'], buffers[buf_index], buf_index,
+                                                          state['next_offset'])
+                    else:
+                        liburing.io_uring_prep_read(sqe, state['target'], buffers[buf_index], state['next_offset'])
+                    liburing.io_uring_sqe_set_flags(sqe, sqe_flags)
+                    liburing.io_uring_sqe_set_data64(sqe, next_tag)
+                    inflight[next_tag] = (state, state['next_offset'], buf_index, time.monotonic())
+                    next_tag += 1
+                    queued += 1
+
+                    state['inflight'] += 1
+                    state['next_offset'] += self.chunk_size
+                    if state['next_offset'] < state['size']:
+                        ready.append(state)
+
+                if queued:
+                    liburing.io_uring_submit(self.ring)
+                if not inflight:
+                    if stopping or not ready:
+                        break
+                    continue
 
-                        # we measure actual read time, not including sleep
-                        actual_read_time = chunk_total_time - sum_of_sleep_times
-                        if actual_read_time == 0:
-                            speed_val = float('inf')
-                        else:
-                            speed_val = (bytes_read_in_chunk / (1024 * 1024)) / actual_read_time
+                tag, res = self._reap()
+                completion_time = time.monotonic()
+                state, offset, buf_index, submitted_at = inflight.pop(tag)
+                free_buffers.append(buf_index)
+                state['inflight'] -= 1
+                path = state['path']
+
+                if not (state['failed'] or stopping):
+                    if res < 0:
+                        state['error'] = OSError(-res, os.strerror(-res), path)
+                        state['failed'] = True
+                    elif res < min(self.chunk_size, state['size'] - offset):
+                        # A short read before the end would leave a hole the progress can never pass
+                        state['error'] = EOFError(f"short read at offset {offset}: {res} bytes")
+                        state['failed'] = True
+                    else:
+                        # Reads queue behind each other in the ring, so time this one from when the
+                        # device got to it (its submission or the previous completion, whichever is later)
+                        elapsed = completion_time - max(submitted_at, last_completion_time)
+                        speed_val = float('inf') if elapsed == 0 else (res / MiB) / elapsed
+                        full_chunk = res == self.chunk_size
+                        if full_chunk or state['min_speed'] == float('inf'):
+                            state['speed'] = speed_val
 
                         # Only perform speed check on full chunks to avoid false negatives at EOF
-                        if bytes_read_in_chunk == self.chunk_size and speed_val < self.MIN_SPEED_MB_S:
-                            self.verdict.emit(str(path), False)
-                            break  # Stop processing this file
-
-                        # Check if it's time to send an update to the GUI
-                        current_time = time.time()
-                        if current_time - last_gui_update_time > GUI_UPDATE_INTERVAL_S:
-                            min_speed_val = min(min_speed_val, speed_val)
-                            max_wait_val = max(max_wait_val, sleep_duration)
-
-                            pct = int(read * 100 / file_size)
-
-                            self.current_speed.emit(str(path), speed_val)
-                            self.progress.emit(str(path), pct)
-                            self.min_speed.emit(str(path), min_speed_val)
-                            self.max_wait.emit(str(path), max_wait_val)
-                            last_gui_update_time = current_time
-                    else:
-                        # This 'else' block runs only if the 'while' loop completes
-                        # without a 'break'. This means the file was read completely.
-                        completed = True
-
-                if completed:
-                    # For files that process faster than the GUI update interval, no signals
-                    # would have been sent. This block ensures a final, complete update is
-                    # always sent upon successful completion.
-                    final_speed = speed_val
-                    final_min_speed = min(min_speed_val, final_speed)
-                    final_max_wait = max(max_wait_val, sleep_duration)
-
-                    self.progress.emit(str(path), 100)
-                    self.current_speed.emit(str(path), final_speed)
-                    self.min_speed.emit(str(path), final_min_speed)
-                    self.max_wait.emit(str(path), final_max_wait)
-                    self.verdict.emit(str(path), True)
+                        if full_chunk and speed_val < self.MIN_SPEED_MB_S:
+                            self.verdict.emit(path, False)
+                            state['failed'] = True
+                        else:
+                            done = state['done']
+                            done[offset] = res
+                            while state['read'] in done:
+                                state['read'] += done.pop(state['read'])
+
+                            # Track min / max on every completion, not only on GUI ticks; the
+                            # EOF tail is too small to time, like the verdict check it is left out
+                            if full_chunk and speed_val < state['min_speed']:
+                                state['min_speed'] = speed_val
+                            if sleep_duration > state['max_wait']:
+                                state['max_wait'] = sleep_duration
+
+                            current_time = time.monotonic()
+                            if current_time - state['last_gui_update'] > GUI_UPDATE_INTERVAL_S:
+                                update = {
+                                    'cur_speed': state['speed'],
+                                    'max_wait': state['max_wait'],
+                                }
+                                if state['min_speed'] != float('inf'):
+                                    update['min_speed'] = state['min_speed']
+                                pct = int(state['read'] * state['pct_scale'])
+                                if pct != state['last_pct']:
+                                    update['progress'] = state['last_pct'] = pct
+                                self.stats.emit(path, update)
+                                state['last_gui_update'] = current_time
+
+                last_completion_time = completion_time
+                if state['inflight'] or not (state['failed'] or stopping or state['next_offset'] >= state['size']):
+                    continue
 
-            except Exception as e:
-                print(f"Error processing {path}: {e}")  # Good to log errors
-                self.verdict.emit(str(path), False)
+                # Last outstanding read of this file, release it and report the outcome
+                active.remove(state)
+                self._close_file(state)
+                free_slots.append(state['slot'])
+                if state['error'] is not None:
+                    print(f"Error processing {path}: {state['error']}")
+                    self.verdict.emit(path, False)
+                elif not (state['failed'] or stopping) and state['read'] >= state['size']:
+                    self.stats.emit(path, {
+                        'progress': 100,
+                        'cur_speed': state['speed'],
+                        # Files shorter than one chunk never get a full chunk timed
+                        'min_speed': state['speed'] if state['min_speed'] == float('inf') else state['min_speed'],
+                        'max_wait': state['max_wait'],
+                    })
+                    self.verdict.emit(path, True)
+        finally:
+            # The kernel still writes into the buffers of pending SQEs, wait for them before closing
+            while inflight:
+                inflight.pop(self._reap()[0])
+            for state in active:
+                self._close_file(state)
+            if self.fixed_files:
+                liburing.io_uring_unregister_files(self.ring)
+            if fixed_buffers:
+                liburing.io_uring_unregister_buffers(self.ring)
 
-        self.finished_all.emit()
 
 class AddFilesDialog(QDialog):
     files_added = Signal(list)
@@ -256,8 +703,19 @@ class AddFilesDialog(QDialog):
     def _add(self):
         raw_lines = self.text.toPlainText().splitlines()
         files = [Path(p.strip()) for p in raw_lines if p.strip()]
-        existing = [f for f in files if f.is_file()]
-        non_existing = [f for f in files if not f.is_file()]
+        # One stat per path answers both "is it a file" and its size, the size travels with the path
+        existing = []
+        non_existing = []
+        for f in files:
+            try:
+                st = f.stat()
+            except OSError:
+                non_existing.append(f)
+                continue
+            if stat.S_ISREG(st.st_mode):
+                existing.append((f, st.st_size))
+            else:
+                non_existing.append(f)
 
         if non_existing:
             QMessageBox.warning(
@@ -270,19 +728,42 @@ class AddFilesDialog(QDialog):
             self.files_added.emit(existing)
         self.accept()
 
+class ProgressDelegate(QStyledItemDelegate):
+    """Paints the progress column as a progress bar, so rows need no QProgressBar widget each"""
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionProgressBar()
+        opt.rect = option.rect
+        opt.state = option.state | QStyle.State_Horizontal
+        opt.minimum = 0
+        opt.maximum = 100
+        opt.progress = index.data(Qt.UserRole) or 0
+        opt.text = f"{opt.progress}%"
+        opt.textVisible = True
+        QApplication.style().drawControl(QStyle.CE_ProgressBar, opt, painter)
+
+    def sizeHint(self, option, index):
+        return QSize(100, super().sizeHint(option, index).height())
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.setWindowTitle("pyFileIntegrityChecker v" + open(get_running_path('version.txt')).read())
+        self.setWindowTitle("pyFileIntegrityChecker v" + Path(get_running_path('version.txt')).read_text().strip())
         self.setWindowIcon(QIcon(get_running_path('icon.ico')))
         self.resize(800, 600)
         self.data = {}
+        self._items = {}  # file path -> {column: cell item}
+        self._pending_stats = {}  # file path -> worker updates not yet applied to the table
+        self._to_scan = {}  # paths without an OK verdict, a dict so scans keep the table order
+        self._dirty = False  # set when something worth saving changed since the last save
         self.folder = None
         self.worker = None
         self.stop_event = Event()
 
         self._setup_ui()
         self._load_data()
+        self._dirty = False  # what was just loaded is already on disk
 
         # Create save worker
         self.save_worker = SaveWorker(data_file)
@@ -294,6 +775,11 @@ class MainWindow(QMainWindow):
         self.autosave_timer.timeout.connect(self._schedule_save)
         self.autosave_timer.start(AUTO_SAVE_INTERVAL_MS)
 
+        # Timer to apply the coalesced worker updates
+        self.flush_timer = QTimer(self)
+        self.flush_timer.timeout.connect(self._flush_stats)
+        self.flush_timer.start(GUI_FLUSH_INTERVAL_MS)
+
     def _setup_ui(self):
         widget = QWidget()
         vbox = QVBoxLayout(widget)
@@ -322,6 +808,15 @@ class MainWindow(QMainWindow):
         self.speed_label = QLabel(f"{self.slider.value()} MB/s")
         h2.addWidget(self.slider)
         h2.addWidget(self.speed_label)
+
+        # How many files are read at the same time, applies from the next scan.
+        # Reads share the speed limit, so more than 1 lowers every file's rate toward MIN_SPEED
+        h2.addWidget(QLabel("Parallel files:"))
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, 16)
+        self.parallel_spin.setValue(FileReadWorker.DEFAULT_PARALLEL_FILES)
+        self.parallel_spin.valueChanged.connect(self.on_parallel_change)
+        h2.addWidget(self.parallel_spin)
         vbox.addLayout(h2)
 
         # Filter dropdown for verdict
@@ -338,12 +833,21 @@ class MainWindow(QMainWindow):
         self.status.setAlignment(Qt.AlignCenter)
         vbox.addWidget(self.status)
 
-        # Files table
-        self.table = QTableWidget(0, 7)
+        # Files table; the proxy filters rows by verdict on top of the model
+        self.model = QStandardItemModel(0, 7)
         headers = ["File", "Size", "Progress", "Cur Speed", "Min Speed", "Max Wait", "Verdict"]
-        self.table.setHorizontalHeaderLabels(headers)
+        self.model.setHorizontalHeaderLabels(headers)
+        self.proxy = QSortFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterKeyColumn(6)
+        for signal in (self.proxy.rowsInserted, self.proxy.rowsRemoved, self.proxy.modelReset,
+                       self.proxy.layoutChanged):
+            signal.connect(self._update_counter)
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
+        self.table.setItemDelegateForColumn(2, ProgressDelegate(self.table))
         # Light blue selection
-        self.table.setStyleSheet("QTableWidget::item:selected { background-color: lightblue; color: black; }")
+        self.table.setStyleSheet("QTableView::item:selected { background-color: lightblue; color: black; }")
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         hdr = self.table.horizontalHeader()
         hdr.setSectionResizeMode(0, QHeaderView.Stretch)
@@ -414,12 +918,14 @@ class MainWindow(QMainWindow):
 
     def _schedule_save(self):
         """Schedule a save operation in the background thread"""
-        if self.data:
+        if self.data and self._dirty:
             state = {
                 'folder': str(self.folder) if self.folder else '',
                 'speed_limit': self.slider.value(),
+                'parallel_files': self.parallel_spin.value(),
                 'files': self.data
             }
+            self._dirty = False
             self.save_worker.schedule_save(state)
 
     def _on_save_complete(self):
@@ -430,6 +936,7 @@ class MainWindow(QMainWindow):
     def _on_save_error(self, error_msg):
         """Called when save operation fails"""
         print(error_msg)  # Log the error
+        self._dirty = True  # try again on the next autosave tick
         # Optional: Show a non-intrusive message to the user
 
     def add_files_manually(self):
@@ -438,32 +945,26 @@ class MainWindow(QMainWindow):
         dlg.show()
 
     def _insert_files(self, files):
-        # files is a list of pathlib.Path objects that already exist
-        row0 = self.table.rowCount()
-        self.table.setRowCount(row0 + len(files))
-
-        for offset, f in enumerate(files):
-            row = row0 + offset
-            self.data[str(f)] = {
-                'size': f.stat().st_size,
-                'progress': 0,
-                'cur_speed': 0.0,
-                'min_speed': None,
-                'max_wait': None,
-                'verdict': ''
-            }
-            self.table.setItem(row, 0, QTableWidgetItem(f.name))
-            self.table.setItem(row, 1, QTableWidgetItem(self._format_size(f.stat().st_size)))
-            self.table.setCellWidget(row, 2, QProgressBar(value=0))
-            self.table.setItem(row, 3, QTableWidgetItem("0.00"))
-            self.table.setItem(row, 4, QTableWidgetItem(""))
-            self.table.setItem(row, 5, QTableWidgetItem(""))
-            self.table.setItem(row, 6, QTableWidgetItem(""))
-
-        # update the visible-rows counter and re-apply the current filter
-        self.counter_label.setText(f"Entries: {self.table.rowCount()}")
+        # files is a list of (pathlib.Path, size) pairs, already stat'd by the dialog
+        row0 = self.model.rowCount()
+        with self._bulk_table_update():
+            self.model.setRowCount(row0 + len(files))
+
+            for offset, (f, size) in enumerate(files):
+                row = row0 + offset
+                fpath_str = str(f)
+                self.data[fpath_str] = {
+                    'size': size,
+                    'progress': 0,
+                    'cur_speed': 0.0,
+                    'min_speed': None,
+                    'max_wait': None,
+                    'verdict': ''
+                }
+                self._fill_row(row, fpath_str, f.name)
+        self._dirty = True
+
         self._update_overall_progress()
-        self.apply_filter(self.filter_combo.currentText())
 
     def browse_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
@@ -484,8 +985,10 @@ class MainWindow(QMainWindow):
 
         # 3. Now it's safe to wipe everything
         self.data.clear()
-        self.table.setRowCount(0)
-        self.counter_label.setText("Entries: 0")
+        self._items.clear()
+        self._pending_stats.clear()
+        self._to_scan.clear()
+        self.model.setRowCount(0)
         self.overall_progress_bar.setValue(0)
         self.overall_progress_bar.setMaximum(0)
         self.folder = None
@@ -499,45 +1002,45 @@ class MainWindow(QMainWindow):
 
     def on_speed_change(self, value):
         self.speed_label.setText(f"{value} MB/s")
+        self._dirty = True
         if self.worker:
             self.worker.speed_limit = value
 
+    def on_parallel_change(self, value):
+        self._dirty = True
+
     def apply_filter(self, text):
-        for i in range(self.table.rowCount()):
-            item = self.table.item(i, 6)
-            val = item.text() if item else ""
-            if text == "All":
-                self.table.setRowHidden(i, False)
-            elif text == "EMPTY":
-                self.table.setRowHidden(i, bool(val))
-            else:
-                self.table.setRowHidden(i, val != text)
+        # The proxy keeps filtering rows as their verdict changes, the counter follows its row count
+        if text == "All":
+            self.proxy.setFilterRegularExpression("")
+        elif text == "EMPTY":
+            self.proxy.setFilterRegularExpression("^$")
+        else:
+            self.proxy.setFilterRegularExpression(f"^{text}$")
+
+    def _update_counter(self):
         # update counter to reflect visible rows
-        visible = sum(not self.table.isRowHidden(i) for i in range(self.table.rowCount()))
-        self.counter_label.setText(f"Entries: {visible}")
+        self.counter_label.setText(f"Entries: {self.proxy.rowCount()}")
 
     def _format_size(self, b):
         return f"{b / 1024 ** 3:.2f} GB" if b >= 1024 ** 3 else f"{b / 1024 ** 2:.2f} MB"
 
     def _populate_table(self):
         # Get all files recursively from all subfolders
-        files = [f for f in self.folder.rglob('*') if f.is_file()]
-        self.table.setRowCount(len(files))
-        # update counter
-        self.counter_label.setText(f"Entries: {len(files)}")
+        root = str(self.folder)
+        files = list(scan_folder(root))
         self.data = {}
-        for i, f in enumerate(files):
-            name = str(f.relative_to(self.folder))  # Show relative path from root folder
-            size = f.stat().st_size
-            self.data[str(f)] = {'size': size, 'progress': 0, 'cur_speed': 0.0,
-                                 'min_speed': None, 'max_wait': None, 'verdict': ''}
-            self.table.setItem(i, 0, QTableWidgetItem(name))
-            self.table.setItem(i, 1, QTableWidgetItem(self._format_size(size)))
-            self.table.setCellWidget(i, 2, QProgressBar(value=0))
-            self.table.setItem(i, 3, QTableWidgetItem("0.00"))
-            self.table.setItem(i, 4, QTableWidgetItem(""))
-            self.table.setItem(i, 5, QTableWidgetItem(""))
-            self.table.setItem(i, 6, QTableWidgetItem(""))
+        self._items = {}
+        self._to_scan = {}
+        with self._bulk_table_update():
+            self.model.setRowCount(0)
+            self.model.setRowCount(len(files))
+            for i, (fpath, size) in enumerate(files):
+                name = os.path.relpath(fpath, root)  # Show relative path from root folder
+                self.data[fpath] = {'size': size, 'progress': 0, 'cur_speed': 0.0,
+                                    'min_speed': None, 'max_wait': None, 'verdict': ''}
+                self._fill_row(i, fpath, name)
+        self._dirty = True
 
         self._update_overall_progress()
 
@@ -548,12 +1051,12 @@ class MainWindow(QMainWindow):
         self.stop_event.clear()
 
         tasks = []
-        for fpath, stats in self.data.items():
-            if stats.get('verdict') == 'OK':
-                continue
+        for fpath in self._to_scan:
+            stats = self.data[fpath]
             size = stats['size']
             start_bytes = int(stats['progress'] / 100 * size)
-            tasks.append((Path(fpath), start_bytes))
+            # The workers fstat the open file and report back a size that no longer matches this one
+            tasks.append((Path(fpath), start_bytes, size))
 
         if not tasks:
             self.status.setText("Nothing to scan")
@@ -561,11 +1064,9 @@ class MainWindow(QMainWindow):
             self.b_stop.setEnabled(False)
             return
 
-        self.worker = FileReadWorker(tasks, 1, self.slider.value(), self.stop_event)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.current_speed.connect(self.update_current_speed)
-        self.worker.min_speed.connect(self.update_min_speed)
-        self.worker.max_wait.connect(self.update_max_wait)
+        worker_cls = UringFileReader if URING_AVAILABLE else FileReadWorker
+        self.worker = worker_cls(tasks, 1, self.slider.value(), self.stop_event, self.parallel_spin.value())
+        self.worker.stats.connect(self.update_stats)
         self.worker.verdict.connect(self.update_verdict)
         self.worker.finished_all.connect(self.on_scan_finished)
         self.worker.start()
@@ -574,89 +1075,116 @@ class MainWindow(QMainWindow):
         self.stop_event.set()
 
     def on_scan_finished(self):
+        self._flush_stats()
         self.status.setText("Stopped")
         self.b_start.setEnabled(True)
         self.b_stop.setEnabled(False)
         self._update_overall_progress()
 
-    def update_progress(self, fname, p):
-        if fname not in self.data:
-            return
-        self.data[fname]['progress'] = p
-
-        # Convert to relative path for comparison
-        if self.folder:
-            rel_path = str(Path(fname).relative_to(self.folder))
+    def update_stats(self, fname, stats):
+        """Queue a worker update, several updates of the same file merge into one"""
+        pending = self._pending_stats.get(fname)
+        if pending is None:
+            self._pending_stats[fname] = stats
         else:
-            rel_path = Path(fname).name
-
-        for i in range(self.table.rowCount()):
-            if self.table.item(i, 0).text() == rel_path:
-                # Only update the progress bar widget, not replace it
-                self.table.cellWidget(i, 2).setValue(p)
-                break
+            pending.update(stats)
 
-    def update_current_speed(self, fname, speed):
-        if fname not in self.data:
+    def _flush_stats(self):
+        """Apply the queued worker updates with one repaint"""
+        if not self._pending_stats:
             return
-        self.data[fname]['cur_speed'] = speed
-        self._set_item(fname, 3, f"{speed:.2f}")
-
-    def update_min_speed(self, fname, s):
-        if fname not in self.data:
-            return
-        self.data[fname]['min_speed'] = s
-        self._set_item(fname, 4, f"{s:.2f}")
-
-    def update_max_wait(self, fname, w):
-        if fname not in self.data:
+        pending, self._pending_stats = self._pending_stats, {}
+        with self._bulk_table_update():
+            for fname, stats in pending.items():
+                self._apply_stats(fname, stats)
+
+    def _apply_stats(self, fname, stats):
+        """Apply one worker update to the data and the row of that file"""
+        row = self.data.get(fname)
+        if row is None:
             return
-        self.data[fname]['max_wait'] = w
-        self._set_item(fname, 5, f"{w:.3f}")
+        last_pct = row['progress']
+        row.update(stats)
+        self._dirty = True
+
+        # Mutate the cached items instead of allocating new ones per update
+        items = self._items[fname]
+        if 'size' in stats:
+            items[1].setText(self._format_size(stats['size']))
+        if stats.get('progress', last_pct) != last_pct:
+            # The delegate paints the bar from this value, skip the repaint when it did not move
+            items[2].setData(stats['progress'], Qt.UserRole)
+        if 'cur_speed' in stats:
+            items[3].setText(f"{stats['cur_speed']:.2f}")
+        if 'min_speed' in stats:
+            items[4].setText(f"{stats['min_speed']:.2f}")
+        if 'max_wait' in stats:
+            items[5].setText(f"{stats['max_wait']:.3f}")
 
     def update_verdict(self, fname, ok):
-        if fname not in self.data:
+        row = self.data.get(fname)
+        if row is None:
             return
         text = 'OK' if ok else 'BAD'
-        self.data[fname]['verdict'] = text
-        item = QTableWidgetItem(text)
+        row['verdict'] = text
+        if ok:
+            self._to_scan.pop(fname, None)
+        else:
+            self._to_scan[fname] = None
+        self._dirty = True
+        item = self._items[fname][6]
+        item.setText(text)
         item.setBackground(Qt.green if ok else Qt.red)
-        self._place_item(fname, 6, item)
         # Update overall progress when a file gets a verdict
         self._update_overall_progress()
 
-    def _set_item(self, fpath, col, val):
-        # Convert to relative path for comparison
-        if self.folder:
-            rel_path = str(Path(fpath).relative_to(self.folder))
-        else:
-            rel_path = Path(fpath).name
-
-        for i in range(self.table.rowCount()):
-            if self.table.item(i, 0).text() == rel_path:
-                self.table.setItem(i, col, QTableWidgetItem(val))
-                break
-
-    def _place_item(self, fpath, col, item):
-        # Convert to relative path for comparison
-        if self.folder:
-            rel_path = str(Path(fpath).relative_to(self.folder))
-        else:
-            rel_path = Path(fpath).name
+    @contextmanager
+    def _bulk_table_update(self):
+        """Suspend repaints and signals of the view while many cells change, one repaint at the end"""
+        # Only the view is silenced, the proxy needs the model signals to stay in sync
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+            self.table.viewport().update()
+
+    def _fill_row(self, row, fpath_str, display_name):
+        """Create the cells of one row from self.data and index them by path"""
+        stats = self.data[fpath_str]
+        self.model.setItem(row, 0, QStandardItem(display_name))
+        items = {
+            1: QStandardItem(self._format_size(stats['size'])),
+            2: QStandardItem(),
+            3: QStandardItem(f"{stats['cur_speed']:.2f}"),
+            4: QStandardItem("" if stats['min_speed'] is None else f"{stats['min_speed']:.2f}"),
+            5: QStandardItem("" if stats['max_wait'] is None else f"{stats['max_wait']:.3f}"),
+            6: QStandardItem(stats.get('verdict', '')),
+        }
+        items[2].setData(stats['progress'], Qt.UserRole)
+        if stats.get('verdict') == 'OK':
+            items[6].setBackground(Qt.green)
+        elif stats.get('verdict') == 'BAD':
+            items[6].setBackground(Qt.red)
+        for col in range(1, 7):
+            self.model.setItem(row, col, items[col])
 
-        for i in range(self.table.rowCount()):
-            if self.table.item(i, 0).text() == rel_path:
-                self.table.setItem(i, col, item)
-                break
+        self._items[fpath_str] = items
+        if stats.get('verdict') != 'OK':
+            self._to_scan[fpath_str] = None
 
     def _load_data(self):
         if not data_file.exists():
             return
         try:
-            state = json.loads(data_file.read_text())
+            raw = data_file.read_bytes()
+            state = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-            # restore speed slider
+            # restore speed slider and parallel files
             self.slider.setValue(state.get('speed_limit', 10))
+            self.parallel_spin.setValue(state.get('parallel_files', FileReadWorker.DEFAULT_PARALLEL_FILES))
 
             # restore last folder if it still exists
             folder = state.get('folder', '')
@@ -668,11 +1196,16 @@ class MainWindow(QMainWindow):
             restored_files = 0
             for fpath_str, stats in state.get('files', {}).items():
                 fpath = Path(fpath_str)
-                if not fpath.is_file():
+                # One stat per entry covers both the existence check and the size
+                try:
+                    st = fpath.stat()
+                except OSError:
                     continue  # skip missing files
+                if not stat.S_ISREG(st.st_mode):
+                    continue
 
                 self.data[str(fpath)] = {
-                    'size': fpath.stat().st_size,
+                    'size': st.st_size,
                     'progress': stats.get('progress', 0),
                     'cur_speed': stats.get('cur_speed', 0.0),
                     'min_speed': stats.get('min_speed'),
@@ -691,35 +1224,21 @@ class MainWindow(QMainWindow):
 
     # helper: recreate the table from self.data
     def _repopulate_table_from_data(self):
-        self.table.setRowCount(0)
-        self.table.setRowCount(len(self.data))
-        for row, (fpath_str, stats) in enumerate(self.data.items()):
-            fpath = Path(fpath_str)
-
-            # Use relative path if we have a folder context, otherwise use filename
-            if self.folder and fpath.is_relative_to(self.folder):
-                display_name = str(fpath.relative_to(self.folder))
-            else:
-                display_name = fpath.name
-
-            self.table.setItem(row, 0, QTableWidgetItem(display_name))
-            self.table.setItem(row, 1, QTableWidgetItem(self._format_size(stats['size'])))
-            bar = QProgressBar(value=stats['progress'])
-            self.table.setCellWidget(row, 2, bar)
-            self.table.setItem(row, 3, QTableWidgetItem(f"{stats['cur_speed']:.2f}"))
-            self.table.setItem(row, 4,
-                               QTableWidgetItem("" if stats['min_speed'] is None else f"{stats['min_speed']:.2f}"))
-            self.table.setItem(row, 5,
-                               QTableWidgetItem("" if stats['max_wait'] is None else f"{stats['max_wait']:.3f}"))
-            verdict = stats.get('verdict', '')
-            item = QTableWidgetItem(verdict)
-            if verdict == 'OK':
-                item.setBackground(Qt.green)
-            elif verdict == 'BAD':
-                item.setBackground(Qt.red)
-            self.table.setItem(row, 6, item)
-
-        self.counter_label.setText(f"Entries: {len(self.data)}")
+        self._items.clear()
+        self._to_scan.clear()
+        # Plain string prefix test instead of Path.is_relative_to / relative_to on every row
+        prefix = os.path.join(str(self.folder), '') if self.folder else None
+        with self._bulk_table_update():
+            self.model.setRowCount(0)
+            self.model.setRowCount(len(self.data))
+            for row, fpath_str in enumerate(self.data):
+                # Use relative path if we have a folder context, otherwise use filename
+                if prefix and fpath_str.startswith(prefix):
+                    display_name = fpath_str[len(prefix):]
+                else:
+                    display_name = os.path.basename(fpath_str)
+
+                self._fill_row(row, fpath_str, display_name)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)